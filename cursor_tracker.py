@@ -0,0 +1,81 @@
+"""Global cursor movement tracker using pynput."""
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QMetaObject, Qt
+
+try:
+    from pynput import mouse
+except ImportError:
+    # No usable input backend (e.g. no X display); the overlay falls back
+    # to polling the cursor position
+    mouse = None
+
+
+class CursorTracker(QObject):
+    """Reports global mouse movement so the overlay doesn't have to poll.
+
+    The overlay is transparent for input most of the time, so it never
+    receives mouse move events itself. A pynput listener thread watches
+    the system-wide pointer instead and forwards movement to the Qt main
+    thread.
+    """
+
+    # Emitted in the main thread after the cursor has moved
+    moved = pyqtSignal()
+
+    def __init__(self):
+        """Initialize cursor tracker."""
+        super().__init__()
+        self.listener = None
+        # Set while a queued emit is waiting in the event loop
+        self._pending = False
+
+    def _on_move(self, x: int, y: int):
+        """Handle a pointer move from pynput's background thread.
+
+        Moves are coalesced: while one notification is still queued, further
+        moves are dropped. The receiver reads the current cursor position
+        itself, so nothing is lost.
+
+        Args:
+            x: Global x coordinate
+            y: Global y coordinate
+        """
+        if not self._pending:
+            self._pending = True
+            QMetaObject.invokeMethod(self, "_do_emit_moved", Qt.QueuedConnection)
+
+    @pyqtSlot()
+    def _do_emit_moved(self):
+        """Thread-safe emit helper for the moved signal."""
+        self._pending = False
+        self.moved.emit()
+
+    def is_running(self) -> bool:
+        """Check whether the listener thread is alive.
+
+        The thread exits on its own if the input backend fails after it was
+        started. A live thread can still receive no events (e.g. on Wayland,
+        or without accessibility permission on macOS), so callers should
+        also watch for missing moves.
+
+        Returns:
+            bool: True if the listener thread is running
+        """
+        return self.listener is not None and self.listener.is_alive()
+
+    def start(self):
+        """Start listening for mouse movement."""
+        if not self.is_running() and mouse is not None:
+            try:
+                self.listener = mouse.Listener(on_move=self._on_move)
+                # Set as daemon thread so it doesn't block application exit
+                self.listener.daemon = True
+                self.listener.start()
+            except Exception as e:
+                print(f"Error starting cursor tracker: {e}")
+                self.listener = None
+
+    def stop(self):
+        """Stop listening for mouse movement."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
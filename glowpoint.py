@@ -218,7 +218,7 @@ Clear: {s('clear_screen')} | Quit: {s('quit')}"""
     def _on_settings_changed(self):
         """Handle settings changes."""
         # Reload overlay settings
-        self.overlay.spotlight_enabled = self.config.get("spotlight", "enabled")
+        self.overlay.reload_settings()
         self.spotlight_action.setText("Spotlight: ON" if self.overlay.spotlight_enabled else "Spotlight: OFF")
 
         # Note: Hotkey changes require restart
@@ -1,11 +1,14 @@
 """Transparent overlay window for cursor highlighting and drawing."""
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QToolButton, QApplication
-from PyQt5.QtCore import Qt, QPoint, QTimer, pyqtSignal, QRectF, QSize
-from PyQt5.QtGui import QPainter, QPen, QColor, QRadialGradient, QCursor, QPainterPath, QPolygonF, QIcon, QPixmap, QFont
-from typing import List, Tuple, Optional
+from PyQt5.QtCore import Qt, QPoint, QPointF, QTimer, pyqtSignal, QRect, QRectF, QSize, QObject
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QRadialGradient, QCursor, QPainterPath, QPolygonF, QIcon, QPixmap, QFont, QFontMetrics, QImage, QGuiApplication
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
+from collections import OrderedDict
 from enum import Enum
 import math
 
+from cursor_tracker import CursorTracker
+
 
 class DrawingMode(Enum):
     """Drawing tool modes."""
@@ -16,6 +19,167 @@ class DrawingMode(Enum):
     CIRCLE = 5
 
 
+class Stroke(NamedTuple):
+    """A finished stroke, ready to be painted."""
+    path: QPainterPath
+    color: QColor
+    width: int
+    mode: DrawingMode
+    bbox: QRect  # Bounds including the glow, in widget coordinates
+
+
+# Drawing tools with a configurable shortcut: (config_key, mode, name)
+_TOOLS = [
+    ("freehand", DrawingMode.FREEHAND, "Freehand"),
+    ("line", DrawingMode.LINE, "Line"),
+    ("rectangle", DrawingMode.RECTANGLE, "Rectangle"),
+    ("arrow", DrawingMode.ARROW, "Arrow"),
+    ("circle", DrawingMode.CIRCLE, "Circle"),
+]
+
+# Qt key codes accepted for each tool shortcut string
+_SHORTCUT_KEYS = {
+    "1": (Qt.Key_1, 0x01000051),
+    "2": (Qt.Key_2, 0x01000052),
+    "3": (Qt.Key_3, 0x01000053),
+    "4": (Qt.Key_4, 0x01000054),
+    "5": (Qt.Key_5, 0x01000055),
+    "6": (Qt.Key_6, 0x01000056),
+    "7": (Qt.Key_7, 0x01000057),
+    "8": (Qt.Key_8, 0x01000058),
+    "9": (Qt.Key_9, 0x01000059),
+    "0": (Qt.Key_0, 0x01000050),
+    "A": (Qt.Key_A,), "B": (Qt.Key_B,), "C": (Qt.Key_C,),
+    "D": (Qt.Key_D,), "E": (Qt.Key_E,), "F": (Qt.Key_F,),
+    "G": (Qt.Key_G,), "H": (Qt.Key_H,), "I": (Qt.Key_I,),
+    "J": (Qt.Key_J,), "K": (Qt.Key_K,), "L": (Qt.Key_L,),
+    "M": (Qt.Key_M,), "N": (Qt.Key_N,), "O": (Qt.Key_O,),
+    "P": (Qt.Key_P,), "Q": (Qt.Key_Q,), "R": (Qt.Key_R,),
+    "S": (Qt.Key_S,), "T": (Qt.Key_T,), "U": (Qt.Key_U,),
+    "V": (Qt.Key_V,), "W": (Qt.Key_W,), "X": (Qt.Key_X,),
+    "Y": (Qt.Key_Y,), "Z": (Qt.Key_Z,),
+}
+
+# Catmull-Rom to Bezier tangent factor (tension 0.5 folded with the 1/3
+# Bezier handle length), multiplied instead of dividing by 6
+_CR_SCALE = 1.0 / 6.0
+
+# Arrowhead sides are 30 degrees off the shaft
+_ARROWHEAD_COS = math.cos(math.pi / 6)
+_ARROWHEAD_SIN = math.sin(math.pi / 6)
+
+
+def _catmull_rom_segments(points: List[QPoint], start: int = 0,
+                          stop: Optional[int] = None) -> List[Tuple[float, float, float, float, int, int]]:
+    """Convert a Catmull-Rom spline through the points into cubic Bezier segments.
+
+    The Catmull-Rom to Bezier basis is applied to every window of four
+    consecutive points (p0, p1, p2, p3), with the indices clamped at the
+    ends of the stroke:
+
+        cp1 = p1 + (p2 - p0) / 6
+        cp2 = p2 - (p3 - p1) / 6
+
+    Args:
+        points: List of QPoint objects (at least 2)
+        start: Index of the first segment to convert
+        stop: Index one past the last segment to convert (default: all)
+
+    Returns:
+        One (cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y) tuple per segment
+    """
+    last = len(points) - 1
+    if stop is None:
+        stop = last
+
+    # Read each coordinate of the needed window once into plain int lists;
+    # the loop below then only indexes lists instead of calling QPoint.x()/y()
+    lo = max(0, start - 1)
+    window = points[lo:min(last, stop + 1) + 1]
+    xs = [p.x() for p in window]
+    ys = [p.y() for p in window]
+    # Repeat the end points where the window reaches the ends of the stroke,
+    # so p0..p3 of segment i are always at k..k+3 (k = i - start) and the
+    # loop needs no index clamping
+    if start == 0:
+        xs.insert(0, xs[0])
+        ys.insert(0, ys[0])
+    if stop >= last:
+        xs.append(xs[-1])
+        ys.append(ys[-1])
+    sc = _CR_SCALE
+    segments = []
+
+    for k in range(stop - start):
+        p1_x, p1_y = xs[k + 1], ys[k + 1]
+        p2_x, p2_y = xs[k + 2], ys[k + 2]
+
+        segments.append((
+            p1_x + (p2_x - xs[k]) * sc,
+            p1_y + (p2_y - ys[k]) * sc,
+            p2_x - (xs[k + 3] - p1_x) * sc,
+            p2_y - (ys[k + 3] - p1_y) * sc,
+            p2_x,
+            p2_y,
+        ))
+
+    return segments
+
+
+def _glow_margin(line_width: int) -> int:
+    """Get how far a feathered stroke reaches beyond its path.
+
+    Args:
+        line_width: Width of the line
+
+    Returns:
+        int: Margin in pixels covering the widest glow pen (2.2x) plus
+        room for antialiasing and miter joins on sharp corners
+    """
+    return int(math.ceil(line_width * 2.2)) + 2
+
+
+# Live stroke layers are placed on multiples of this many logical pixels:
+# a whole number of device pixels at every scale factor in steps of 1/8, so
+# blitting them never resamples
+_LAYER_ALIGN = 8
+
+# Room added around a freehand layer so it isn't re-allocated on every move
+_LAYER_SLACK = 128
+
+
+def _align_layer_rect(rect: QRect) -> QRect:
+    """Grow a rect outwards to _LAYER_ALIGN boundaries.
+
+    Args:
+        rect: Rect in logical pixels
+
+    Returns:
+        QRect: Smallest aligned rect containing it
+    """
+    mask = ~(_LAYER_ALIGN - 1)
+    left = rect.left() & mask
+    top = rect.top() & mask
+    right = (rect.right() + _LAYER_ALIGN) & mask
+    bottom = (rect.bottom() + _LAYER_ALIGN) & mask
+    return QRect(left, top, right - left, bottom - top)
+
+
+def _segment_box(segment: Tuple[float, ...]) -> Tuple[int, int, int, int]:
+    """Get the integer bounds of a cubic segment's control polygon.
+
+    Args:
+        segment: (start_x, start_y, cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y)
+
+    Returns:
+        (left, top, right, bottom), containing the whole curve
+    """
+    xs = segment[0::2]
+    ys = segment[1::2]
+    return (int(math.floor(min(xs))), int(math.floor(min(ys))),
+            int(math.ceil(max(xs))), int(math.ceil(max(ys))))
+
+
 class DrawingToolbar(QWidget):
     """Floating toolbar for drawing tool selection."""
 
@@ -33,6 +197,8 @@ class DrawingToolbar(QWidget):
         self.config = config_manager
         self.current_mode = DrawingMode.FREEHAND
         self.buttons = {}
+        # Global screen rect of each tool button (see _update_button_rects)
+        self._button_global_rects: List[Tuple[QRect, DrawingMode]] = []
 
         self._setup_ui()
 
@@ -58,31 +224,36 @@ class DrawingToolbar(QWidget):
             (DrawingMode.CIRCLE, "○", "Circle", "circle"),
         ]
 
+        # One stylesheet for all tool buttons, parsed once for the toolbar
+        self.setStyleSheet("""
+            QToolButton {
+                background-color: rgba(50, 50, 50, 200);
+                border: 1px solid rgba(100, 100, 100, 150);
+                border-radius: 4px;
+                color: white;
+            }
+            QToolButton:hover {
+                background-color: rgba(80, 80, 80, 220);
+                border: 1px solid rgba(150, 150, 150, 200);
+            }
+            QToolButton:checked {
+                background-color: rgba(70, 130, 180, 220);
+                border: 2px solid rgba(100, 180, 255, 255);
+            }
+        """)
+        font = QFont("Segoe UI Symbol", 14)
+
         for mode, symbol, name, config_key in tools:
             shortcut = self.config.get("drawing", "tool_shortcuts", config_key) or config_key[0]
             btn = QToolButton()
             btn.setText(symbol)
-            btn.setFont(QFont("Segoe UI Symbol", 14))
+            btn.setFont(font)
             btn.setFixedSize(36, 36)
             btn.setToolTip(f"{name} (Press {shortcut})")
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QToolButton {
-                    background-color: rgba(50, 50, 50, 200);
-                    border: 1px solid rgba(100, 100, 100, 150);
-                    border-radius: 4px;
-                    color: white;
-                }
-                QToolButton:hover {
-                    background-color: rgba(80, 80, 80, 220);
-                    border: 1px solid rgba(150, 150, 150, 200);
-                }
-                QToolButton:checked {
-                    background-color: rgba(70, 130, 180, 220);
-                    border: 2px solid rgba(100, 180, 255, 255);
-                }
-            """)
-            btn.clicked.connect(lambda checked, m=mode: self._on_tool_clicked(m))
+            # All buttons share one slot, which reads the mode back from the button
+            btn.setProperty("drawing_mode", mode.value)
+            btn.clicked.connect(self._on_any_tool_clicked)
             layout.addWidget(btn)
             self.buttons[mode] = btn
 
@@ -91,6 +262,14 @@ class DrawingToolbar(QWidget):
 
         self.adjustSize()
 
+    def _on_any_tool_clicked(self, checked: bool):
+        """Handle a click on any tool button.
+
+        Args:
+            checked: Checked state of the clicked button
+        """
+        self._on_tool_clicked(DrawingMode(self.sender().property("drawing_mode")))
+
     def _on_tool_clicked(self, mode: DrawingMode):
         """Handle tool button click.
 
@@ -110,6 +289,55 @@ class DrawingToolbar(QWidget):
         for m, btn in self.buttons.items():
             btn.setChecked(m == mode)
 
+    def mode_at(self, global_pos: QPoint) -> Optional[DrawingMode]:
+        """Find the tool button under a global screen position.
+
+        Args:
+            global_pos: Global screen position
+
+        Returns:
+            The drawing mode of the button at that position, or None
+        """
+        for rect, mode in self._button_global_rects:
+            if rect.contains(global_pos):
+                return mode
+        return None
+
+    def _update_button_rects(self):
+        """Recompute the global screen rects of the tool buttons."""
+        origin = self.mapToGlobal(QPoint(0, 0))
+        self._button_global_rects = [
+            (btn.geometry().translated(origin), mode)
+            for mode, btn in self.buttons.items()
+        ]
+
+    def moveEvent(self, event):
+        """Keep button hit rects in sync with the toolbar position.
+
+        Args:
+            event: Move event
+        """
+        super().moveEvent(event)
+        self._update_button_rects()
+
+    def resizeEvent(self, event):
+        """Keep button hit rects in sync with the toolbar layout.
+
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self._update_button_rects()
+
+    def showEvent(self, event):
+        """Compute button hit rects once the toolbar is laid out on screen.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self._update_button_rects()
+
     def position_at_bottom_right(self):
         """Position the toolbar at bottom-right of the primary screen."""
         screen = QApplication.primaryScreen()
@@ -140,6 +368,13 @@ class OverlayWindow(QWidget):
     # Signal emitted when drawing mode changes
     mode_changed = pyqtSignal(str)  # Emits mode name
 
+    # Feathering pen sets kept around (colors x widths x corner styles)
+    _PEN_CACHE_SIZE = 64
+
+    # Thickness indicator colors
+    _WHITE_200 = QColor(255, 255, 255, 200)
+    _WHITE = QColor(255, 255, 255, 255)
+
     def __init__(self, config_manager):
         """Initialize overlay window.
 
@@ -149,10 +384,31 @@ class OverlayWindow(QWidget):
         super().__init__()
         self.config = config_manager
         self.drawing_active = False
-        self.current_color = None
+        self.current_color: Optional[QColor] = None
         self.current_path = []
         self.current_line_width = None
-        self.all_paths: List[Tuple[List[QPoint], str, int, DrawingMode]] = []  # path, color, line_width, mode
+        # Backing store with every saved stroke already rendered; None when stale
+        self._strokes_layer: Optional[QPixmap] = None
+        # Device pixel ratio the cached pixmaps were rendered for
+        self._pixmap_dpr = 1.0
+        # Scratch layer holding the rendered in-progress stroke; None when stale
+        self._current_layer: Optional[QPixmap] = None
+        self._current_layer_rect = QRect()  # Layer area in widget coordinates
+        # Part of the freehand layer to re-render on the next paint
+        self._live_dirty = QRect()
+        # Smoothed in-progress freehand stroke, minus its still-changing last
+        # segment, and the point list / count it was built from
+        self._live_path = QPainterPath()
+        self._live_source: Optional[List[QPoint]] = None
+        self._live_point_count = 0
+        self._live_settled = 0  # Number of settled segments in _live_path
+        # The settled segments as (start_x, start_y, cp1_x, cp1_y, cp2_x,
+        # cp2_y, end_x, end_y), their bounds (see _segment_box), and the
+        # union of those bounds
+        self._live_segments: List[Tuple[float, ...]] = []
+        self._live_boxes: List[Tuple[int, int, int, int]] = []
+        self._live_box: Optional[Tuple[int, int, int, int]] = None
+        self.all_paths: List[Stroke] = []
         self.spotlight_enabled = self.config.get("spotlight", "enabled")
         self.last_cursor_pos = QPoint(0, 0)
         self.last_line_endpoint = None  # For shift+click straight lines
@@ -160,25 +416,63 @@ class OverlayWindow(QWidget):
         # Thickness preview
         self.show_thickness_preview = False
         self.thickness_preview_timer = None
-
-        # Shift+click straight line mode
-        self.shift_line_start = None
-        self.shift_line_preview = None
+        # Pre-rendered indicator and its bounds relative to the cursor, per line width
+        self._thickness_pixmap_cache: Dict[int, Tuple[QPixmap, QRect]] = {}
 
         # Drawing mode (freehand, line, rectangle, arrow)
         self.drawing_mode = DrawingMode.FREEHAND
         self.shape_start_pos = None  # Start position for shapes (rect, arrow, line)
+        # Freehand points closer than 8 pixels to the previous one are dropped
+        # (squared, so the move handler needs no sqrt)
+        self._decimation_sq = 8 * 8
+
+        # Path builders per drawing mode, called as builder(points, line_width)
+        self._path_builders: Dict[DrawingMode, Callable[[List[QPoint], int], QPainterPath]] = {
+            DrawingMode.FREEHAND: self._create_smooth_path,
+            DrawingMode.LINE: self._create_line_path,
+            DrawingMode.RECTANGLE: self._create_rectangle_path,
+            DrawingMode.ARROW: self._create_arrow_path,
+            DrawingMode.CIRCLE: self._create_circle_path,
+        }
+        self._last_shape_rect = QRect()  # Area of the last shape preview repaint
+
+        # Repaint requested from mouse input, flushed once per event loop pass
+        self._update_pending = False
+        self._pending_update_rect = QRect()
 
         # Undo/redo stack
-        self.undo_stack = []
+        self.undo_stack: List[Stroke] = []
+
+        # Feathering pens keyed by (rgba, line_width, sharp_corners), least
+        # recently used first and capped at _PEN_CACHE_SIZE entries
+        self._pen_cache: "OrderedDict[Tuple[int, int, bool], Tuple[QPen, ...]]" = OrderedDict()
+        # Drawing colors parsed from their hex strings, keyed by the string
+        self._color_cache: Dict[str, QColor] = {}
+
+        # Cached config values read on every paint (see reload_settings)
+        self._line_width = 4
+        self._spotlight_radius = 80
+        self._spotlight_ring_radius = 40
+        self._spotlight_extent = 0
+        self._spotlight_pixmap = QPixmap()
+        # Settings the spotlight pixmap was rendered with
+        self._spotlight_key: Optional[tuple] = None
+        # Qt key code -> (drawing mode, status label) for the tool shortcuts
+        self._tool_shortcut_keys: Dict[int, Tuple[DrawingMode, str]] = {}
+        # Cursor tracking must exist before settings are applied (and before
+        # the window is first shown, see showEvent)
+        self._setup_cursor_timer()
+        self.reload_settings()
 
         # Drawing toolbar
         self.toolbar = DrawingToolbar(self.config)
         self.toolbar.tool_selected.connect(self._on_toolbar_tool_selected)
         self.toolbar.hide()
 
+        # Last applied virtual desktop geometry (see _update_geometry)
+        self._virtual_geom: Optional[QRect] = None
+
         self._setup_window()
-        self._setup_cursor_timer()
         self._setup_thickness_preview_timer()
 
     def _setup_window(self):
@@ -187,8 +481,7 @@ class OverlayWindow(QWidget):
         self.setWindowFlags(
             Qt.WindowStaysOnTopHint |
             Qt.FramelessWindowHint |
-            Qt.Tool |
-            Qt.WindowTransparentForInput
+            Qt.Tool
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_ShowWithoutActivating)
@@ -196,21 +489,116 @@ class OverlayWindow(QWidget):
         # Calculate and set geometry to cover all screens
         self._update_geometry()
 
-        # Connect to screen change signals to handle display reconfiguration
-        from PyQt5.QtWidgets import QApplication
+        # Screen changes tend to arrive in bursts (one signal per affected
+        # screen); collapse them into a single geometry update
+        self._geom_debounce = QTimer(self)
+        self._geom_debounce.setSingleShot(True)
+        self._geom_debounce.setInterval(100)
+        self._geom_debounce.timeout.connect(self._update_geometry)
+
+        # Connect to screen change signals to handle display reconfiguration.
+        # The connections are kept so closeEvent can drop them again.
+        self._screen_connections = []
         app = QApplication.instance()
         if app:
-            # Connect to screen added/removed signals
-            app.screenAdded.connect(self._on_screen_changed)
-            app.screenRemoved.connect(self._on_screen_changed)
-            # Connect to primary screen changed signal
-            app.primaryScreenChanged.connect(self._on_screen_changed)
+            self._screen_connections += [
+                # Connect to screen added/removed signals
+                app.screenAdded.connect(self._on_screen_added),
+                app.screenRemoved.connect(self._on_screen_changed),
+                # Connect to primary screen changed signal
+                app.primaryScreenChanged.connect(self._on_screen_changed),
+            ]
             # Also monitor for geometry changes on existing screens
             for screen in app.screens():
-                screen.geometryChanged.connect(self._on_screen_changed)
+                self._screen_connections.append(screen.geometryChanged.connect(self._on_screen_changed))
 
+        # Start click-through. Input passthrough is only ever toggled on the
+        # native window, never through the window flags, so create the native
+        # window first (before it is shown)
+        self.winId()
+        self._set_input_passthrough(True)
         self.show()
 
+    def reload_settings(self):
+        """Re-read drawing and spotlight settings from the configuration.
+
+        Paint code reads these cached values instead of walking the config
+        dict on every frame, so this must be called whenever the settings
+        change outside the overlay (e.g. from the settings dialog).
+        """
+        self.spotlight_enabled = self.config.get("spotlight", "enabled")
+        self._line_width = self.config.get("drawing", "line_width") or 4
+        self._spotlight_radius = self.config.get("spotlight", "radius")
+        self._spotlight_ring_radius = self.config.get("spotlight", "ring_radius")
+        self._build_tool_shortcut_keys()
+
+        self._render_spotlight_pixmap()
+
+        # Spotlight may have been switched on or off
+        self._ensure_cursor_timer()
+        self.update()
+
+    def _render_spotlight_pixmap(self):
+        """Pre-render the spotlight glow and ring from the cached settings.
+
+        The spotlight looks the same wherever the cursor is, so painting it
+        is a single blit of this pixmap.
+        """
+        opacity = self.config.get("spotlight", "opacity")
+        color_hex = self.config.get("spotlight", "color")
+        # Settings reloads that don't touch the spotlight keep the pixmap;
+        # it is rendered for the screen's pixel density as well
+        key = (self._spotlight_radius, self._spotlight_ring_radius, color_hex, opacity,
+               self.devicePixelRatioF())
+        if key == self._spotlight_key:
+            return
+        self._spotlight_key = key
+
+        # Ring pen is 3px wide; one extra pixel for antialiasing
+        extent = int(max(self._spotlight_radius, self._spotlight_ring_radius)) + 3
+        self._spotlight_extent = extent
+
+        base_color = QColor(color_hex)
+        r, g, b = base_color.red(), base_color.green(), base_color.blue()
+
+        pixmap = self._device_pixmap(QSize(2 * extent, 2 * extent))
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        center = QPointF(extent, extent)
+
+        # Draw bright glowing circle around cursor with opacity control
+        radius = self._spotlight_radius
+        gradient = QRadialGradient(center, radius)
+        gradient.setColorAt(0, QColor(r, g, b, int(180 * opacity)))
+        gradient.setColorAt(0.3, QColor(r, g, b, int(120 * opacity)))
+        gradient.setColorAt(0.7, QColor(r, g, b, int(60 * opacity)))
+        gradient.setColorAt(1, QColor(255, 255, 255, 0))  # Transparent edge
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(center, radius, radius)
+
+        # Draw bright ring for emphasis
+        ring_radius = self._spotlight_ring_radius
+        painter.setPen(QPen(QColor(r, g, b, int(200 * opacity)), 3))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(center, ring_radius, ring_radius)
+        painter.end()
+
+        self._spotlight_pixmap = pixmap
+
+    def _on_screen_added(self, screen):
+        """Start monitoring a newly connected screen.
+
+        Screens present at startup are connected in _setup_window; each
+        screen's geometryChanged is connected exactly once.
+
+        Args:
+            screen: The added QScreen
+        """
+        self._screen_connections.append(screen.geometryChanged.connect(self._on_screen_changed))
+        self._on_screen_changed()
+
     def _on_screen_changed(self, *args):
         """Handle screen configuration changes (add/remove/resize).
 
@@ -218,34 +606,187 @@ class OverlayWindow(QWidget):
             *args: Signal arguments (varies by signal type)
         """
         print("[OverlayWindow] Screen configuration changed, updating geometry...")
-        self._update_geometry()
+        self._geom_debounce.start()
 
     def _update_geometry(self):
         """Calculate and set window geometry to cover all screens."""
-        from PyQt5.QtWidgets import QApplication
-        desktop = QApplication.desktop()
+        screen = QGuiApplication.primaryScreen()
+        if screen is None:
+            return
+
+        # Union of all screens in the virtual desktop, computed by Qt
+        virtual_geom = screen.virtualGeometry()
+        if virtual_geom == self._virtual_geom:
+            # Spurious change signal; skip the no-op setGeometry repaint
+            return
+        self._virtual_geom = virtual_geom
 
-        # Calculate bounding rectangle that covers all screens
-        x_min = y_min = float('inf')
-        x_max = y_max = float('-inf')
+        self.setGeometry(virtual_geom)
+        print(f"[OverlayWindow] Covering {len(QGuiApplication.screens())} screens: "
+              f"{virtual_geom.x()},{virtual_geom.y()} "
+              f"{virtual_geom.width()}x{virtual_geom.height()}")
 
-        for i in range(desktop.screenCount()):
-            screen_geom = desktop.screenGeometry(i)
-            x_min = min(x_min, screen_geom.x())
-            y_min = min(y_min, screen_geom.y())
-            x_max = max(x_max, screen_geom.x() + screen_geom.width())
-            y_max = max(y_max, screen_geom.y() + screen_geom.height())
+    def _set_input_passthrough(self, enabled: bool):
+        """Toggle whether mouse input passes through the overlay.
 
-        # Set geometry to cover all screens
-        self.setGeometry(int(x_min), int(y_min), int(x_max - x_min), int(y_max - y_min))
-        print(f"[OverlayWindow] Covering {desktop.screenCount()} screens: "
-              f"{int(x_min)},{int(y_min)} {int(x_max - x_min)}x{int(y_max - y_min)}")
+        The flag is changed on the native window handle instead of through
+        setWindowFlags(), which would destroy and re-create the window (and
+        force a hide/show) on every drawing mode toggle.
+
+        Args:
+            enabled: True to let input reach the windows underneath
+        """
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, enabled)
+        window = self.windowHandle()
+        if window is not None:
+            window.setFlag(Qt.WindowTransparentForInput, enabled)
 
     def _setup_cursor_timer(self):
-        """Set up timer for cursor position updates."""
+        """Set up cursor tracking for the spotlight.
+
+        Cursor moves are reported by a global mouse listener; the polling
+        timer is only used if that listener cannot be started. In drawing
+        mode the overlay also receives the moves itself (mouse tracking).
+        """
+        self.cursor_tracker = CursorTracker()
+        self.cursor_tracker.moved.connect(self._on_cursor_moved)
+
+        # One display frame
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+        frame_interval = max(int(1000 / refresh_rate) if refresh_rate > 0 else 16, 1)
+
+        # Listener moves are applied at most once per frame: the first move
+        # right away, later ones in the same frame when the frame ends
+        self._cursor_throttle = QTimer()
+        self._cursor_throttle.setSingleShot(True)
+        self._cursor_throttle.setInterval(frame_interval)
+        self._cursor_throttle.timeout.connect(self._on_cursor_throttle_timeout)
+        self._cursor_move_pending = False
+
+        # Fallback polling, once per display frame
         self.cursor_timer = QTimer()
+        self.cursor_timer.setInterval(frame_interval)
+        # A precise timer raises the OS timer resolution; coarse is fine for the glow
+        self.cursor_timer.setTimerType(Qt.CoarseTimer)
         self.cursor_timer.timeout.connect(self._update_cursor_position)
-        self.cursor_timer.start(16)  # ~60 FPS
+
+        # The listener can stay alive without delivering events (Wayland,
+        # missing macOS accessibility permission, hook dropped by Windows).
+        # A slow poll checks that it still reports moves while it is used.
+        self._cursor_watchdog = QTimer()
+        self._cursor_watchdog.setInterval(500)
+        self._cursor_watchdog.setTimerType(Qt.CoarseTimer)
+        self._cursor_watchdog.timeout.connect(self._check_cursor_tracker)
+        self._watchdog_cursor_pos = QPoint()
+        self._tracker_reported_move = False
+        self._tracker_missed_checks = 0
+        # Set once the listener has failed; polling is used from then on
+        self._cursor_tracker_failed = False
+
+    def _on_cursor_moved(self):
+        """Handle a cursor move reported by the global listener."""
+        self._tracker_reported_move = True
+        if self._cursor_throttle.isActive():
+            self._cursor_move_pending = True
+            return
+        self._update_cursor_position()
+        self._cursor_throttle.start()
+
+    def _on_cursor_throttle_timeout(self):
+        """Apply the last cursor move that arrived during the frame."""
+        if self._cursor_move_pending:
+            self._cursor_move_pending = False
+            self._update_cursor_position()
+            self._cursor_throttle.start()
+
+    def _ensure_cursor_timer(self):
+        """Track the global cursor only while the spotlight follows it."""
+        if self.isVisible() and self.spotlight_enabled:
+            if not self._cursor_tracker_failed:
+                self.cursor_tracker.start()
+            if self.cursor_tracker.is_running():
+                self.cursor_timer.stop()
+                if not self._cursor_watchdog.isActive():
+                    self._watchdog_cursor_pos = QCursor.pos()
+                    self._tracker_reported_move = False
+                    self._tracker_missed_checks = 0
+                    self._cursor_watchdog.start()
+                # The cursor may have moved while tracking was off
+                self._update_cursor_position()
+            elif not self.cursor_timer.isActive():
+                self._cursor_watchdog.stop()
+                self.cursor_timer.start()
+        else:
+            self.cursor_tracker.stop()
+            self._cursor_watchdog.stop()
+            self.cursor_timer.stop()
+
+    def _check_cursor_tracker(self):
+        """Fall back to polling if the listener stopped reporting moves.
+
+        The cursor moving between two checks without a single reported move
+        counts as a miss; two misses in a row (so a move still queued in the
+        event loop isn't mistaken for one) switch to the polling timer.
+        """
+        pos = QCursor.pos()
+        moved = pos != self._watchdog_cursor_pos
+        self._watchdog_cursor_pos = pos
+        if moved and not self._tracker_reported_move:
+            self._tracker_missed_checks += 1
+        else:
+            self._tracker_missed_checks = 0
+        self._tracker_reported_move = False
+
+        if not self.cursor_tracker.is_running() or self._tracker_missed_checks >= 2:
+            print("[OverlayWindow] Cursor tracker is not reporting moves, polling the cursor instead")
+            self._cursor_tracker_failed = True
+            self.cursor_tracker.stop()
+            self._ensure_cursor_timer()
+
+    def showEvent(self, event):
+        """Resume cursor tracking when the overlay is shown.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self._ensure_cursor_timer()
+
+    def hideEvent(self, event):
+        """Stop cursor tracking while the overlay is hidden.
+
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.cursor_tracker.stop()
+        self._cursor_watchdog.stop()
+        self.cursor_timer.stop()
+
+    def closeEvent(self, event):
+        """Stop listening for screen changes once the overlay is closed.
+
+        Args:
+            event: Close event
+        """
+        # Connections of removed screens are already gone; disconnect()
+        # just returns False for those
+        for connection in self._screen_connections:
+            QObject.disconnect(connection)
+        self._screen_connections = []
+        self._geom_debounce.stop()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        """Drop the strokes layer when the overlay changes size.
+
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        # Rebuilt at the new size on the next paint
+        self._strokes_layer = None
 
     def _setup_thickness_preview_timer(self):
         """Set up timer for thickness preview."""
@@ -254,13 +795,65 @@ class OverlayWindow(QWidget):
         self.thickness_preview_timer.setSingleShot(True)
 
     def _update_cursor_position(self):
-        """Update cursor position for spotlight effect."""
+        """Update cursor position from the global cursor."""
+        # Spotlight is painted in widget coordinates
+        self._move_cursor_to(self.mapFromGlobal(QCursor.pos()))
+
+    def _move_cursor_to(self, pos: QPoint):
+        """Move the cursor-following effects to a new position.
+
+        Args:
+            pos: Cursor position in widget coordinates
+        """
+        old_pos = self.last_cursor_pos
+        if pos == old_pos:
+            return  # Cursor hasn't moved, nothing to repaint
+        self.last_cursor_pos = pos
+
+        # Only repaint the areas the effects leave and enter
         if self.spotlight_enabled:
-            self.last_cursor_pos = QCursor.pos()
-            self.update()  # Trigger repaint
-        elif self.drawing_active:
-            # Still need to repaint when drawing is active (even without spotlight)
-            self.update()
+            self.update(self._spotlight_rect(old_pos).united(self._spotlight_rect(pos)))
+        if self.show_thickness_preview and self.drawing_active:
+            self.update(self._thickness_preview_rect(old_pos).united(self._thickness_preview_rect(pos)))
+
+    def _spotlight_rect(self, center: QPoint) -> QRect:
+        """Get the area covered by the spotlight around a point.
+
+        Args:
+            center: Spotlight center in widget coordinates
+
+        Returns:
+            QRect: Bounding rectangle of the glow and ring
+        """
+        extent = self._spotlight_extent
+        return QRect(center.x() - extent, center.y() - extent, 2 * extent, 2 * extent)
+
+    def _thickness_preview_rect(self, center: QPoint) -> QRect:
+        """Get the area covered by the thickness preview around a point.
+
+        Args:
+            center: Cursor position in widget coordinates
+
+        Returns:
+            QRect: Bounding rectangle of the indicator
+        """
+        _, bounds = self._thickness_preview_pixmap(self._line_width)
+        return bounds.translated(center)
+
+    def _resolve_color(self, color_hex: str) -> QColor:
+        """Get the QColor for a hex color string, parsing it only once.
+
+        Args:
+            color_hex: Color as a hex string (e.g. "#F44336")
+
+        Returns:
+            QColor: Parsed color
+        """
+        color = self._color_cache.get(color_hex)
+        if color is None:
+            color = QColor(color_hex)
+            self._color_cache[color_hex] = color
+        return color
 
     def _hide_thickness_preview(self):
         """Hide the thickness preview indicator."""
@@ -276,27 +869,20 @@ class OverlayWindow(QWidget):
         print(f"[OverlayWindow] start_drawing called with color: {color}")
         self.drawing_active = True
         color_hex = self.config.get("drawing", "colors", color)
-        self.current_color = color_hex
-        self.current_line_width = self.config.get("drawing", "line_width")  # Capture current width
+        # Strokes and pens reuse this QColor
+        self.current_color = self._resolve_color(color_hex)
+        self.current_line_width = self._line_width  # Capture current width
         self.current_path = []
+        self._current_layer = None
         print(f"[OverlayWindow] Color hex: {color_hex}, drawing_active: {self.drawing_active}")
 
         # Make window accept mouse events
-        # Must hide before changing flags for them to take effect
-        print("[OverlayWindow] Hiding window before flag change")
-        self.hide()
-        self.setWindowFlags(
-            Qt.WindowStaysOnTopHint |
-            Qt.FramelessWindowHint |
-            Qt.Tool
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setAttribute(Qt.WA_ShowWithoutActivating)
-        # Refresh geometry to ensure we cover all current screens
-        self._update_geometry()
-        print("[OverlayWindow] Showing with cross cursor")
-        self.show()
+        self._set_input_passthrough(False)
+        print("[OverlayWindow] Accepting input with cross cursor")
         self.setCursor(Qt.CrossCursor)
+        # Receive cursor moves (not just drags) for the thickness preview
+        self.setMouseTracking(True)
+        self._ensure_cursor_timer()
         # Grab keyboard focus so we receive key events (1-4 for tools, Escape, Ctrl+Z, etc.)
         self.activateWindow()
         self.raise_()
@@ -314,10 +900,11 @@ class OverlayWindow(QWidget):
         """Stop drawing mode."""
         if self.drawing_active and self.current_path:
             # Save the current path with its line width and mode
-            self.all_paths.append((self.current_path.copy(), self.current_color, self.current_line_width, self.drawing_mode))
+            self._commit_stroke(self.current_path, self.drawing_mode)
 
         self.drawing_active = False
         self.current_path = []
+        self._current_layer = None
         self.current_color = None
         self.last_line_endpoint = None
         self.shape_start_pos = None
@@ -326,26 +913,131 @@ class OverlayWindow(QWidget):
         self.toolbar.hide()
 
         # Make window transparent to mouse events again
-        # Must hide before changing flags for them to take effect
-        self.hide()
-        self.setWindowFlags(
-            Qt.WindowStaysOnTopHint |
-            Qt.FramelessWindowHint |
-            Qt.Tool |
-            Qt.WindowTransparentForInput
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setAttribute(Qt.WA_ShowWithoutActivating)
-        # Refresh geometry to ensure we cover all current screens
-        self._update_geometry()
-        self.show()
+        self._set_input_passthrough(True)
         self.unsetCursor()
+        self.setMouseTracking(False)
+        self._ensure_cursor_timer()
         self.update()
 
+    def _commit_stroke(self, points: List[QPoint], mode: DrawingMode):
+        """Save a finished stroke in the current color and line width.
+
+        Only the built path is kept, so callers can hand over their point
+        list without copying it.
+
+        Args:
+            points: Points of the stroke
+            mode: Drawing mode the stroke was made with
+        """
+        line_width = self.current_line_width
+        # Saved strokes never change: build the (smoothed) path once
+        painter_path = self._create_path_for_mode(points, mode, line_width)
+        # Bounds including the widest glow pass, used to skip strokes outside the repainted area
+        margin = _glow_margin(line_width)
+        bbox = painter_path.boundingRect().toAlignedRect()
+        bbox.adjust(-margin, -margin, margin, margin)
+        stroke = Stroke(painter_path, self.current_color, line_width, mode, bbox)
+        self.all_paths.append(stroke)
+        self._stamp_stroke(stroke)
+
+    def _stamp_stroke(self, stroke: Stroke):
+        """Render one more saved stroke on top of the strokes layer.
+
+        Args:
+            stroke: Saved stroke entry from all_paths
+        """
+        if self._strokes_layer is None:
+            return  # Layer is rebuilt from all_paths on the next paint
+
+        painter = QPainter(self._strokes_layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_stroke(painter, stroke)
+        painter.end()
+
+    def _device_pixmap(self, size: QSize) -> QPixmap:
+        """Create a pixmap of a logical size at the screen's pixel density.
+
+        Painting into it and drawing it use logical coordinates, so cached
+        layers stay as sharp as painting straight onto a HiDPI screen.
+
+        Args:
+            size: Size in logical (widget) pixels
+
+        Returns:
+            QPixmap: Pixmap with the device pixel ratio applied
+        """
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def _check_pixmap_dpr(self):
+        """Drop cached pixmaps rendered for a different device pixel ratio.
+
+        The ratio changes when the overlay moves to another screen or the
+        display scaling changes.
+        """
+        dpr = self.devicePixelRatioF()
+        if dpr == self._pixmap_dpr:
+            return
+        self._pixmap_dpr = dpr
+        self._strokes_layer = None
+        self._current_layer = None
+        self._render_spotlight_pixmap()
+        self._thickness_pixmap_cache.clear()
+
+    def _rebuild_strokes_layer(self):
+        """Render all saved strokes into a fresh widget-sized layer."""
+        self._strokes_layer = self._device_pixmap(self.size())
+        self._strokes_layer.fill(Qt.transparent)
+
+        painter = QPainter(self._strokes_layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for stroke in self.all_paths:
+            self._draw_stroke(painter, stroke)
+        painter.end()
+
+    def _redraw_strokes_layer_rect(self, rect: QRect):
+        """Re-render one area of the strokes layer from all_paths.
+
+        Used when a stroke is removed: only strokes whose bounds reach into
+        the area are drawn again, clipped to it, instead of rebuilding the
+        whole layer.
+
+        Args:
+            rect: Area to re-render, in widget coordinates
+        """
+        if self._strokes_layer is None:
+            return  # Layer is rebuilt from all_paths on the next paint
+
+        painter = QPainter(self._strokes_layer)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(rect, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setClipRect(rect)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for stroke in self.all_paths:
+            if stroke.bbox.intersects(rect):
+                self._draw_stroke(painter, stroke)
+        painter.end()
+
+    def _draw_stroke(self, painter: QPainter, stroke: Stroke):
+        """Draw a saved stroke with feathering/glow effect.
+
+        Args:
+            painter: QPainter instance
+            stroke: Saved stroke entry from all_paths
+        """
+        sharp_corners = (stroke.mode == DrawingMode.RECTANGLE)
+        self._draw_feathered_path(painter, stroke.path, stroke.color, stroke.width, sharp_corners)
+
     def clear_drawings(self):
         """Clear all drawings from the screen."""
         self.all_paths.clear()
+        self._strokes_layer = None
         self.current_path.clear()
+        self._live_source = None
+        self._current_layer = None
         self.undo_stack.clear()
         self.update()
 
@@ -355,8 +1047,10 @@ class OverlayWindow(QWidget):
             # Move the last path to undo stack for potential redo
             undone_path = self.all_paths.pop()
             self.undo_stack.append(undone_path)
+            # Re-render the strokes that overlapped the removed one
+            self._redraw_strokes_layer_rect(undone_path.bbox)
             print(f"[OverlayWindow] Undo: removed path, {len(self.all_paths)} paths remaining")
-            self.update()
+            self.update(undone_path.bbox)
             return True
         return False
 
@@ -366,8 +1060,9 @@ class OverlayWindow(QWidget):
             # Restore the last undone path
             restored_path = self.undo_stack.pop()
             self.all_paths.append(restored_path)
+            self._stamp_stroke(restored_path)
             print(f"[OverlayWindow] Redo: restored path, {len(self.all_paths)} paths total")
-            self.update()
+            self.update(restored_path.bbox)
             return True
         return False
 
@@ -375,6 +1070,7 @@ class OverlayWindow(QWidget):
         """Toggle cursor spotlight on/off."""
         self.spotlight_enabled = not self.spotlight_enabled
         self.config.set(self.spotlight_enabled, "spotlight", "enabled")
+        self._ensure_cursor_timer()
         self.update()
 
     def _on_toolbar_tool_selected(self, mode: DrawingMode):
@@ -384,6 +1080,7 @@ class OverlayWindow(QWidget):
             mode: The drawing mode selected
         """
         self.drawing_mode = mode
+        self._current_layer = None
         print(f"[OverlayWindow] Tool selected from toolbar: {mode.name}")
         # Refocus the overlay window to receive keyboard events
         self.activateWindow()
@@ -403,6 +1100,27 @@ class OverlayWindow(QWidget):
             return toolbar_geom.contains(global_pos)
         return False
 
+    def _schedule_update(self, rect: Optional[QRect] = None):
+        """Request a repaint, coalescing bursts of mouse events.
+
+        High polling rate mice deliver many moves per frame; their dirty
+        rects are merged and handed to update() once the event loop is idle.
+
+        Args:
+            rect: Area to repaint, or None for the whole overlay
+        """
+        self._pending_update_rect = self._pending_update_rect.united(rect if rect is not None else self.rect())
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self):
+        """Hand the accumulated dirty rect to update()."""
+        self._update_pending = False
+        rect = self._pending_update_rect
+        self._pending_update_rect = QRect()
+        self.update(rect)
+
     def mousePressEvent(self, event):
         """Handle mouse press events.
 
@@ -411,38 +1129,37 @@ class OverlayWindow(QWidget):
         """
         # Check if click is on the toolbar - if so, forward the click to toolbar
         if self._is_point_in_toolbar(event.globalPos()):
-            # Find which button was clicked and trigger it
-            for mode, btn in self.toolbar.buttons.items():
-                btn_global_geom = btn.rect()
-                btn_global_geom.moveTopLeft(btn.mapToGlobal(btn.rect().topLeft()))
-                if btn_global_geom.contains(event.globalPos()):
-                    btn.click()
-                    return
+            # Select the tool under the click directly
+            mode = self.toolbar.mode_at(event.globalPos())
+            if mode is not None:
+                self.toolbar.set_mode(mode)
+                self._on_toolbar_tool_selected(mode)
             return
 
         if self.drawing_active and event.button() == Qt.LeftButton:
-            from PyQt5.QtCore import Qt as QtModifier
-
             if self.drawing_mode == DrawingMode.FREEHAND:
                 # Check if shift is held for straight line mode
-                if event.modifiers() & QtModifier.ShiftModifier and self.last_line_endpoint:
+                if event.modifiers() & Qt.ShiftModifier and self.last_line_endpoint:
                     # Draw straight line from last endpoint to current position
-                    self.current_path = [self.last_line_endpoint, event.pos()]
-                    self.all_paths.append((self.current_path.copy(), self.current_color, self.current_line_width, DrawingMode.LINE))
+                    self._commit_stroke([self.last_line_endpoint, event.pos()], DrawingMode.LINE)
                     self.last_line_endpoint = event.pos()
                     self.current_path = []
-                    self.update()
+                    self._current_layer = None
+                    self._schedule_update()
                 else:
                     # Normal freehand drawing
                     self.current_path = [event.pos()]
+                    self._current_layer = None
                     self.last_line_endpoint = None
-                    self.update()  # Draw dot immediately on click
+                    self._schedule_update()  # Draw dot immediately on click
 
             elif self.drawing_mode in (DrawingMode.LINE, DrawingMode.RECTANGLE, DrawingMode.ARROW, DrawingMode.CIRCLE):
                 # For shape tools, store start position
                 self.shape_start_pos = event.pos()
                 self.current_path = [event.pos()]
-                self.update()  # Draw dot immediately on click
+                self._current_layer = None
+                self._last_shape_rect = QRect()
+                self._schedule_update()  # Draw dot immediately on click
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events.
@@ -450,31 +1167,84 @@ class OverlayWindow(QWidget):
         Args:
             event: Mouse event
         """
+        if self.drawing_active:
+            self._move_cursor_to(event.pos())
+
         if self.drawing_active and event.buttons() & Qt.LeftButton:
             if self.drawing_mode == DrawingMode.FREEHAND:
-                # Check if in shift+click straight line mode
-                if self.shift_line_start is not None:
-                    self.shift_line_preview = event.pos()
-                    self.update()
+                # Add point decimation to reduce jaggedness on sharp corners
+                # Only add point if it's far enough from the last point
+                pos = event.pos()
+                if len(self.current_path) > 0:
+                    last_point = self.current_path[-1]
+                    dx = pos.x() - last_point.x()
+                    dy = pos.y() - last_point.y()
+                    # Compare squared distance to avoid a sqrt per move
+                    if dx * dx + dy * dy > self._decimation_sq:
+                        self.current_path.append(pos)
+                        self._invalidate_freehand_tail()
                 else:
-                    # Add point decimation to reduce jaggedness on sharp corners
-                    # Only add point if it's far enough from the last point
-                    if len(self.current_path) > 0:
-                        last_point = self.current_path[-1]
-                        distance = ((event.pos().x() - last_point.x()) ** 2 +
-                                   (event.pos().y() - last_point.y()) ** 2) ** 0.5
-                        # Increased threshold to 8 pixels for smoother lines
-                        if distance > 8:
-                            self.current_path.append(event.pos())
-                    else:
-                        self.current_path.append(event.pos())
-                    self.update()
+                    self.current_path.append(pos)
+                    self._invalidate_freehand_tail()
 
             elif self.drawing_mode in (DrawingMode.LINE, DrawingMode.RECTANGLE, DrawingMode.ARROW, DrawingMode.CIRCLE):
                 # For shape tools, update end position for preview
                 if self.shape_start_pos:
-                    self.current_path = [self.shape_start_pos, event.pos()]
-                    self.update()
+                    # Only the end point moves; update it in place
+                    if len(self.current_path) == 2:
+                        self.current_path[1] = event.pos()
+                    else:
+                        self.current_path = [self.shape_start_pos, event.pos()]
+                    self._current_layer = None
+                    # Repaint where the previous preview was and where the new one is
+                    shape_rect = self._live_shape_rect()
+                    self._schedule_update(shape_rect.united(self._last_shape_rect))
+                    self._last_shape_rect = shape_rect
+
+    def _invalidate_freehand_tail(self):
+        """Mark the part of the freehand stroke changed by a new point.
+
+        Once the stroke is long enough to have settled segments, only the
+        tail area of the live layer is re-rendered (see
+        _update_current_layer); shorter strokes are simply rendered again.
+        """
+        rect = self._freehand_tail_rect()
+        if self._current_layer is not None and len(self.current_path) > 3:
+            self._live_dirty = self._live_dirty.united(rect)
+        else:
+            self._current_layer = None
+        self._schedule_update(rect)
+
+    def _freehand_tail_rect(self) -> QRect:
+        """Get the area changed by the last point added to a freehand stroke.
+
+        A new point adds one curve segment and bends the one before it, so
+        only the last four points (the Catmull-Rom window of those segments)
+        are involved.
+
+        Returns:
+            QRect: Bounds of the changed segments including the glow
+        """
+        tail = self.current_path[-4:]
+        xs = [p.x() for p in tail]
+        ys = [p.y() for p in tail]
+        x_min, x_max = min(xs), max(xs)
+        y_min, y_max = min(ys), max(ys)
+        # Bezier control points can overshoot the points by up to 1/6 of their span
+        overshoot = max(x_max - x_min, y_max - y_min) // 6 + 1
+        pad = _glow_margin(self.current_line_width or 4) + overshoot
+        return QRect(x_min - pad, y_min - pad, x_max - x_min + 2 * pad, y_max - y_min + 2 * pad)
+
+    def _live_shape_rect(self) -> QRect:
+        """Get the area covered by the shape being dragged out.
+
+        Returns:
+            QRect: Bounds of the shape preview including the glow
+        """
+        line_width = self.current_line_width or 4
+        painter_path = self._create_path_for_mode(self.current_path, self.drawing_mode, line_width)
+        margin = _glow_margin(line_width)
+        return painter_path.boundingRect().toAlignedRect().adjusted(-margin, -margin, margin, margin)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events.
@@ -485,62 +1255,36 @@ class OverlayWindow(QWidget):
         if self.drawing_active and event.button() == Qt.LeftButton:
             if self.drawing_mode == DrawingMode.FREEHAND:
                 if self.current_path and len(self.current_path) > 0:
-                    self.all_paths.append((self.current_path.copy(), self.current_color, self.current_line_width, DrawingMode.FREEHAND))
+                    self._commit_stroke(self.current_path, DrawingMode.FREEHAND)
                     # Save last point for shift+click straight lines
                     self.last_line_endpoint = self.current_path[-1]
                     self.current_path = []
+                    self._current_layer = None
 
             elif self.drawing_mode in (DrawingMode.LINE, DrawingMode.RECTANGLE, DrawingMode.ARROW, DrawingMode.CIRCLE):
                 # Save the shape
                 if self.shape_start_pos and len(self.current_path) >= 2:
-                    self.all_paths.append((self.current_path.copy(), self.current_color, self.current_line_width, self.drawing_mode))
+                    self._commit_stroke(self.current_path, self.drawing_mode)
                 self.shape_start_pos = None
                 self.current_path = []
+                self._current_layer = None
 
-            self.update()
+            self._schedule_update()
 
-    def _key_matches_shortcut(self, key: int, shortcut: str) -> bool:
-        """Check if a key code matches a shortcut string.
+    def _build_tool_shortcut_keys(self):
+        """Resolve the configured tool shortcuts to Qt key codes.
 
-        Args:
-            key: Qt key code
-            shortcut: Shortcut string (e.g., "1", "a", "F1")
-
-        Returns:
-            True if the key matches the shortcut
+        keyPressEvent then finds the tool for a key with one dict lookup
+        instead of matching every shortcut string on each key press.
         """
-        from PyQt5.QtCore import Qt as QtKey
-        if not shortcut:
-            return False
-
-        shortcut = shortcut.upper()
-
-        # Map shortcut strings to Qt key codes
-        key_map = {
-            "1": (QtKey.Key_1, 0x01000051),
-            "2": (QtKey.Key_2, 0x01000052),
-            "3": (QtKey.Key_3, 0x01000053),
-            "4": (QtKey.Key_4, 0x01000054),
-            "5": (QtKey.Key_5, 0x01000055),
-            "6": (QtKey.Key_6, 0x01000056),
-            "7": (QtKey.Key_7, 0x01000057),
-            "8": (QtKey.Key_8, 0x01000058),
-            "9": (QtKey.Key_9, 0x01000059),
-            "0": (QtKey.Key_0, 0x01000050),
-            "A": (QtKey.Key_A,), "B": (QtKey.Key_B,), "C": (QtKey.Key_C,),
-            "D": (QtKey.Key_D,), "E": (QtKey.Key_E,), "F": (QtKey.Key_F,),
-            "G": (QtKey.Key_G,), "H": (QtKey.Key_H,), "I": (QtKey.Key_I,),
-            "J": (QtKey.Key_J,), "K": (QtKey.Key_K,), "L": (QtKey.Key_L,),
-            "M": (QtKey.Key_M,), "N": (QtKey.Key_N,), "O": (QtKey.Key_O,),
-            "P": (QtKey.Key_P,), "Q": (QtKey.Key_Q,), "R": (QtKey.Key_R,),
-            "S": (QtKey.Key_S,), "T": (QtKey.Key_T,), "U": (QtKey.Key_U,),
-            "V": (QtKey.Key_V,), "W": (QtKey.Key_W,), "X": (QtKey.Key_X,),
-            "Y": (QtKey.Key_Y,), "Z": (QtKey.Key_Z,),
-        }
-
-        if shortcut in key_map:
-            return key in key_map[shortcut]
-        return False
+        shortcuts = self.config.get("drawing", "tool_shortcuts") or {}
+        keys = {}
+        for config_key, mode, name in _TOOLS:
+            shortcut = shortcuts.get(config_key) or ""
+            for key in _SHORTCUT_KEYS.get(shortcut.upper(), ()):
+                # Earlier tools win if two share a shortcut
+                keys.setdefault(key, (mode, f"{name} ({shortcut})"))
+        self._tool_shortcut_keys = keys
 
     def keyPressEvent(self, event):
         """Handle key press events.
@@ -548,43 +1292,35 @@ class OverlayWindow(QWidget):
         Args:
             event: Key event
         """
-        from PyQt5.QtCore import Qt as QtKey
         key = event.key()
+        modifiers = event.modifiers()
         # Debug: print all key presses to diagnose issues
-        print(f"[OverlayWindow] Key pressed: {key} (hex: {hex(key)}), modifiers: {int(event.modifiers())}")
+        print(f"[OverlayWindow] Key pressed: {key} (hex: {hex(key)}), modifiers: {int(modifiers)}")
 
         if self.drawing_active:
-            if key == QtKey.Key_Escape:
+            if key == Qt.Key_Escape:
                 print("[OverlayWindow] Escape key pressed, stopping drawing")
                 self.stop_drawing()
-            elif key == QtKey.Key_Z and event.modifiers() == (QtKey.ControlModifier | QtKey.ShiftModifier):
+            elif key == Qt.Key_Z and modifiers == (Qt.ControlModifier | Qt.ShiftModifier):
                 # Ctrl+Shift+Z = Redo
                 if self.redo():
                     print("[OverlayWindow] Redo performed")
                     self.mode_changed.emit("Redo")
-            elif key == QtKey.Key_Z and event.modifiers() == QtKey.ControlModifier:
+            elif key == Qt.Key_Z and modifiers == Qt.ControlModifier:
                 # Ctrl+Z = Undo
                 if self.undo():
                     print("[OverlayWindow] Undo performed")
                     self.mode_changed.emit("Undo")
             else:
-                # Check tool shortcuts from config
-                shortcuts = self.config.get("drawing", "tool_shortcuts") or {}
-                tool_map = [
-                    ("freehand", DrawingMode.FREEHAND, "Freehand"),
-                    ("line", DrawingMode.LINE, "Line"),
-                    ("rectangle", DrawingMode.RECTANGLE, "Rectangle"),
-                    ("arrow", DrawingMode.ARROW, "Arrow"),
-                    ("circle", DrawingMode.CIRCLE, "Circle"),
-                ]
-                for config_key, mode, name in tool_map:
-                    shortcut = shortcuts.get(config_key, "")
-                    if self._key_matches_shortcut(key, shortcut):
-                        self.drawing_mode = mode
-                        self.toolbar.set_mode(mode)
-                        print(f"[OverlayWindow] Switched to {mode.name} mode")
-                        self.mode_changed.emit(f"{name} ({shortcut})")
-                        break
+                # Tool shortcuts from config (see _build_tool_shortcut_keys)
+                tool = self._tool_shortcut_keys.get(key)
+                if tool is not None:
+                    mode, label = tool
+                    self.drawing_mode = mode
+                    self._current_layer = None
+                    self.toolbar.set_mode(mode)
+                    print(f"[OverlayWindow] Switched to {mode.name} mode")
+                    self.mode_changed.emit(label)
 
     def wheelEvent(self, event):
         """Handle mouse wheel events for changing line thickness.
@@ -593,8 +1329,11 @@ class OverlayWindow(QWidget):
             event: Wheel event
         """
         if self.drawing_active:
+            # The preview is drawn at the cursor
+            self._move_cursor_to(event.position().toPoint())
+
             # Get current line width
-            current_width = self.config.get("drawing", "line_width")
+            current_width = self._line_width
 
             # Adjust based on wheel direction
             delta = event.angleDelta().y()
@@ -608,7 +1347,9 @@ class OverlayWindow(QWidget):
             # Save new width and update current line width for future strokes
             if new_width != current_width:
                 self.config.set(new_width, "drawing", "line_width")
+                self._line_width = new_width
                 self.current_line_width = new_width  # Update for next stroke
+                self._current_layer = None
                 print(f"[OverlayWindow] Line width changed to {new_width}px")
                 # Show thickness preview indicator for 1 second
                 self.show_thickness_preview = True
@@ -621,216 +1362,320 @@ class OverlayWindow(QWidget):
         Args:
             event: Paint event
         """
+        # Nothing to paint in the dirty area: skip painter setup entirely
+        # (the translucent backing store is already cleared for us)
+        if not self.spotlight_enabled and not self.current_path and not self.show_thickness_preview:
+            dirty = event.rect()
+            if not any(stroke.bbox.intersects(dirty) for stroke in self.all_paths):
+                event.accept()
+                return
+
+        dirty = event.rect()
+        self._check_pixmap_dpr()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Hard clip to the dirty rect so draws outside it are rejected early
+        painter.setClipRect(dirty)
 
         # Draw spotlight effect
-        if self.spotlight_enabled:
+        if self.spotlight_enabled and dirty.intersects(self._spotlight_rect(self.last_cursor_pos)):
             self._draw_spotlight(painter)
 
-        # Draw all saved paths with feathering/glow effect
-        for path, color, path_line_width, mode in self.all_paths:
-            if len(path) >= 1:
-                painter_path = self._create_path_for_mode(path, mode, path_line_width)
-                sharp_corners = (mode == DrawingMode.RECTANGLE)
-                self._draw_feathered_path(painter, painter_path, QColor(color), path_line_width, sharp_corners)
-
-        # Draw current path being drawn
-        if self.current_path and len(self.current_path) >= 1 and self.current_color:
-            painter_path = self._create_path_for_mode(self.current_path, self.drawing_mode, self.current_line_width or 4)
-            sharp_corners = (self.drawing_mode == DrawingMode.RECTANGLE)
-            self._draw_feathered_path(painter, painter_path, QColor(self.current_color), self.current_line_width, sharp_corners)
-
-        # Draw shift+click straight line preview
-        if self.shift_line_start is not None and self.shift_line_preview is not None:
-            preview_path = QPainterPath()
-            preview_path.moveTo(self.shift_line_start)
-            preview_path.lineTo(self.shift_line_preview)
-            self._draw_feathered_path(painter, preview_path, QColor(self.current_color), self.current_line_width)
+        # Draw all saved paths from the pre-rendered strokes layer; only the
+        # dirty part of the (screen-sized) layer is copied. The source rect
+        # is in the layer's device pixels.
+        if self.all_paths:
+            if self._strokes_layer is None:
+                self._rebuild_strokes_layer()
+            dpr = self._strokes_layer.devicePixelRatio()
+            source = QRectF(dirty.x() * dpr, dirty.y() * dpr, dirty.width() * dpr, dirty.height() * dpr)
+            painter.drawPixmap(QRectF(dirty), self._strokes_layer, source)
+
+        # Draw current path being drawn (re-rendered only when the stroke changes)
+        if self.current_path and len(self.current_path) >= 1 and self.current_color is not None:
+            if self._current_layer is None:
+                self._render_current_layer()
+            elif not self._live_dirty.isEmpty():
+                self._update_current_layer()
+            painter.drawPixmap(self._current_layer_rect.topLeft(), self._current_layer)
 
         # Draw thickness preview indicator (like Blender's brush size indicator)
         if self.show_thickness_preview and self.drawing_active:
-            cursor_pos = QCursor.pos()
-            current_line_width = self.config.get("drawing", "line_width") or 4
-            # Use the line width as diameter (radius = line_width / 2 for the actual stroke)
-            # But also show the glow extent (roughly 2.2x the line width)
-            inner_radius = current_line_width / 2
-            outer_radius = current_line_width * 1.1  # Show approximate glow extent
-
-            # Draw outer dashed circle (glow extent) - white with black outline for visibility
-            pen = QPen(QColor(255, 255, 255, 200), 1, Qt.DashLine)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawEllipse(cursor_pos, int(outer_radius), int(outer_radius))
-
-            # Draw inner solid circle (actual line width)
-            pen = QPen(QColor(255, 255, 255, 255), 2, Qt.SolidLine)
-            painter.setPen(pen)
-            painter.drawEllipse(cursor_pos, int(inner_radius), int(inner_radius))
-
-            # Draw text showing the size
-            painter.setPen(QColor(255, 255, 255, 255))
-            painter.setFont(QFont("Arial", 10, QFont.Bold))
-            text_pos = QPoint(cursor_pos.x() + int(outer_radius) + 5, cursor_pos.y() + 5)
-            painter.drawText(text_pos, f"{current_line_width}px")
+            pixmap, bounds = self._thickness_preview_pixmap(self._line_width)
+            target = bounds.translated(self.last_cursor_pos)
+            if dirty.intersects(target):
+                painter.drawPixmap(target.topLeft(), pixmap)
 
-    def _draw_feathered_path(self, painter: QPainter, path: QPainterPath, color: QColor, line_width: int, sharp_corners: bool = False):
-        """Draw a path with feathering/glow effect.
+    def _thickness_preview_pixmap(self, line_width: int) -> Tuple[QPixmap, QRect]:
+        """Get the pre-rendered thickness preview indicator for a line width.
+
+        The rings and label are rasterized once per width (dashed strokes
+        are slow to draw) and blitted at the cursor afterwards.
+
+        Args:
+            line_width: Line width to preview
+
+        Returns:
+            Tuple of the indicator pixmap and its logical bounds relative to the cursor
+        """
+        cached = self._thickness_pixmap_cache.get(line_width)
+        if cached is not None:
+            return cached
+
+        # Use the line width as diameter (radius = line_width / 2 for the actual stroke)
+        # But also show the glow extent (roughly 2.2x the line width)
+        inner_radius = int(line_width / 2)
+        outer_radius = int(line_width * 1.1)  # Show approximate glow extent
+
+        font = QFont("Arial", 10, QFont.Bold)
+        text = f"{line_width}px"
+        text_pos = QPoint(outer_radius + 5, 5)
+
+        # Bounds around the cursor: rings plus pen width, and the label
+        bounds = QRect(-outer_radius - 2, -outer_radius - 2, 2 * outer_radius + 4, 2 * outer_radius + 4)
+        bounds = bounds.united(QFontMetrics(font).boundingRect(text).translated(text_pos).adjusted(-1, -1, 1, 1))
+
+        pixmap = self._device_pixmap(bounds.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-bounds.topLeft())
+        center = QPoint(0, 0)
+
+        # Draw outer dashed circle (glow extent) - white with black outline for visibility
+        painter.setPen(QPen(self._WHITE_200, 1, Qt.DashLine))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(center, outer_radius, outer_radius)
+
+        # Draw inner solid circle (actual line width)
+        painter.setPen(QPen(self._WHITE, 2, Qt.SolidLine))
+        painter.drawEllipse(center, inner_radius, inner_radius)
+
+        # Draw text showing the size
+        painter.setPen(self._WHITE)
+        painter.setFont(font)
+        painter.drawText(text_pos, text)
+        painter.end()
+
+        cached = (pixmap, bounds)
+        self._thickness_pixmap_cache[line_width] = cached
+        return cached
+
+    def _feathered_pens(self, color: QColor, line_width: int, sharp_corners: bool = False) -> Tuple[QPen, ...]:
+        """Get the pens used for the feathering/glow effect.
+
+        Pens are built once per color/width/corner style and reused, so
+        repaints don't allocate new QColor/QPen objects for every stroke.
 
         Args:
-            painter: QPainter instance
-            path: Path to draw
             color: Color of the line
             line_width: Width of the line
             sharp_corners: If True, use MiterJoin for sharp corners (for rectangles)
+
+        Returns:
+            Tuple of pens, outermost glow first and the main line last
         """
+        key = (color.rgba(), line_width, sharp_corners)
+        pens = self._pen_cache.get(key)
+        if pens is not None:
+            self._pen_cache.move_to_end(key)
+            return pens
+
         # Use MiterJoin for sharp corners (rectangles), RoundJoin for curves
         join_style = Qt.MiterJoin if sharp_corners else Qt.RoundJoin
         cap_style = Qt.SquareCap if sharp_corners else Qt.RoundCap
 
-        # Draw outer glow layers (3 layers for subtle feathering)
+        # Outer glow layers (3 layers for subtle feathering)
         glow_layers = [
             (line_width * 2.2, 20),   # Outermost glow, very transparent
             (line_width * 1.6, 40),   # Middle glow
             (line_width * 1.2, 70),   # Inner glow
         ]
 
+        pens = []
         for width_mult, alpha in glow_layers:
             glow_color = QColor(color.red(), color.green(), color.blue(), alpha)
-            glow_pen = QPen(glow_color, width_mult, Qt.SolidLine, cap_style, join_style)
-            painter.setPen(glow_pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawPath(path)
-
-        # Draw the main line on top
-        main_pen = QPen(color, line_width, Qt.SolidLine, cap_style, join_style)
-        painter.setPen(main_pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(path)
+            pens.append(QPen(glow_color, width_mult, Qt.SolidLine, cap_style, join_style))
 
-    def _draw_circle_preview(self, painter: QPainter, center: QPoint, edge: QPoint, color: QColor, line_width: int):
-        """Draw a circle preview centered on 'center' with radius to 'edge'.
+        # Main line on top
+        pens.append(QPen(color, line_width, Qt.SolidLine, cap_style, join_style))
 
-        Args:
-            painter: QPainter instance
-            center: Center point of circle
-            edge: Point on edge (determines radius)
-            color: Color of the circle
-            line_width: Width of the line
-        """
-        import math
-        dx = edge.x() - center.x()
-        dy = edge.y() - center.y()
-        radius = int(math.sqrt(dx * dx + dy * dy))
+        pens = tuple(pens)
+        self._pen_cache[key] = pens
+        if len(self._pen_cache) > self._PEN_CACHE_SIZE:
+            self._pen_cache.popitem(last=False)
+        return pens
 
-        if radius < 2:
-            return
+    def _render_current_layer(self):
+        """Render the in-progress stroke into its scratch pixmap.
 
-        # Create circle path
+        The pixmap covers the stroke's bounds (plus glow) and is reused by
+        every repaint until the stroke changes, so cursor-driven repaints
+        don't re-stroke it. A growing freehand stroke is then only updated
+        where it changed (see _update_current_layer); its layer gets some
+        room to grow into.
+        """
+        self._live_dirty = QRect()
+        line_width = self.current_line_width or 4
+        freehand = self.drawing_mode == DrawingMode.FREEHAND
+        if freehand:
+            painter_path = self._live_smooth_path()
+        else:
+            painter_path = self._create_path_for_mode(self.current_path, self.drawing_mode, line_width)
+        margin = _glow_margin(line_width)
+        if freehand:
+            margin += _LAYER_SLACK
+        rect = _align_layer_rect(painter_path.boundingRect().toAlignedRect().adjusted(-margin, -margin, margin, margin))
+
+        layer = self._device_pixmap(rect.size())
+        layer.fill(Qt.transparent)
+        layer_painter = QPainter(layer)
+        layer_painter.setRenderHint(QPainter.Antialiasing)
+        layer_painter.translate(-rect.x(), -rect.y())
+        sharp_corners = (self.drawing_mode == DrawingMode.RECTANGLE)
+        self._draw_feathered_path(layer_painter, painter_path, self.current_color, line_width, sharp_corners)
+        layer_painter.end()
+
+        self._current_layer = layer
+        self._current_layer_rect = rect
+
+    def _update_current_layer(self):
+        """Re-render only the changed tail area of the freehand layer.
+
+        Stamping just the new segments on top would blend the translucent
+        glow twice where they overlap the old ones. Instead the dirty area is
+        cleared and drawn again from every segment that reaches into it,
+        clipped to it, which gives the same pixels as rendering the whole
+        stroke. Only the cheap bounds check looks at all segments.
+        """
+        dirty = self._live_dirty
+        self._live_dirty = QRect()
+        line_width = self.current_line_width or 4
+        margin = _glow_margin(line_width)
+
+        tail = self._advance_live_segments()
+        tail_box = _segment_box(tail)
+        left, top, right, bottom = self._live_box
+        needed = QRect(QPoint(min(left, tail_box[0]) - margin, min(top, tail_box[1]) - margin),
+                       QPoint(max(right, tail_box[2]) + margin, max(bottom, tail_box[3]) + margin))
+        if not self._current_layer_rect.contains(needed):
+            self._grow_current_layer(needed)
+
+        # Segments whose glow reaches the dirty area, or the half-res glow
+        # texels next to it
+        reach = dirty.adjusted(-margin - 2, -margin - 2, margin + 2, margin + 2)
+        reach_left, reach_top, reach_right, reach_bottom = reach.left(), reach.top(), reach.right(), reach.bottom()
         path = QPainterPath()
-        path.addEllipse(center, radius, radius)
-        self._draw_feathered_path(painter, path, color, line_width)
-
-    def _draw_rect_preview(self, painter: QPainter, corner1: QPoint, corner2: QPoint, color: QColor, line_width: int):
-        """Draw a rectangle preview from corner1 to corner2.
+        previous = -2
+        segments = self._live_segments
+        boxes = self._live_boxes
+        for i in range(len(segments) + 1):
+            if i < len(segments):
+                segment, box = segments[i], boxes[i]
+            else:
+                segment, box = tail, tail_box
+            if box[2] < reach_left or box[0] > reach_right or box[3] < reach_top or box[1] > reach_bottom:
+                continue
+            if i != previous + 1:
+                path.moveTo(segment[0], segment[1])
+            path.cubicTo(*segment[2:])
+            previous = i
+
+        layer_painter = QPainter(self._current_layer)
+        layer_painter.translate(-self._current_layer_rect.x(), -self._current_layer_rect.y())
+        layer_painter.setClipRect(dirty)
+        layer_painter.setCompositionMode(QPainter.CompositionMode_Source)
+        layer_painter.fillRect(dirty, Qt.transparent)
+        layer_painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        layer_painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_feathered_path(layer_painter, path, self.current_color, line_width)
+        layer_painter.end()
+
+    def _grow_current_layer(self, rect: QRect):
+        """Enlarge the freehand layer to cover an area, keeping its content.
 
         Args:
-            painter: QPainter instance
-            corner1: First corner
-            corner2: Opposite corner
-            color: Color of the rectangle
-            line_width: Width of the line
+            rect: Area the layer must cover, in widget coordinates
         """
-        from PyQt5.QtCore import QRectF
-
-        x1, y1 = corner1.x(), corner1.y()
-        x2, y2 = corner2.x(), corner2.y()
-
-        if abs(x2 - x1) < 2 and abs(y2 - y1) < 2:
-            return
+        old_rect = self._current_layer_rect
+        rect = _align_layer_rect(rect.united(old_rect).adjusted(-_LAYER_SLACK, -_LAYER_SLACK, _LAYER_SLACK, _LAYER_SLACK))
+        layer = self._device_pixmap(rect.size())
+        layer.fill(Qt.transparent)
+        layer_painter = QPainter(layer)
+        layer_painter.drawPixmap(old_rect.topLeft() - rect.topLeft(), self._current_layer)
+        layer_painter.end()
+        self._current_layer = layer
+        self._current_layer_rect = rect
 
-        # Create rectangle path
-        path = QPainterPath()
-        rect = QRectF(min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1))
-        path.addRect(rect)
-        self._draw_feathered_path(painter, path, color, line_width)
+    def _draw_feathered_path(self, painter: QPainter, path: QPainterPath, color: QColor, line_width: int, sharp_corners: bool = False):
+        """Draw a path with feathering/glow effect.
 
-    def _draw_arrow(self, painter: QPainter, start: QPoint, end: QPoint, color: QColor, line_width: int):
-        """Draw an arrow with line and filled arrowhead.
+        The painter must have no brush set, which is the default for a new
+        QPainter; every layer painter is a fresh one, so the brush isn't
+        reset for each stroke.
 
         Args:
             painter: QPainter instance
-            start: Start point of arrow
-            end: End point (tip of arrowhead)
-            color: Color of the arrow
+            path: Path to draw
+            color: Color of the line
             line_width: Width of the line
+            sharp_corners: If True, use MiterJoin for sharp corners (for rectangles)
         """
-        import math
+        pens = self._feathered_pens(color, line_width, sharp_corners)
+        self._draw_glow(painter, path, pens[:-1], line_width)
 
-        dx = end.x() - start.x()
-        dy = end.y() - start.y()
-        length = math.sqrt(dx * dx + dy * dy)
-
-        if length < 2:
-            return
-
-        # Normalize direction
-        nx = dx / length
-        ny = dy / length
-
-        # Arrowhead size proportional to line width (matching screenshot style)
-        head_length = max(line_width * 4, 15)
-        head_width = max(line_width * 2.5, 10)
-
-        # Calculate arrowhead base point
-        base_x = end.x() - nx * head_length
-        base_y = end.y() - ny * head_length
-
-        # Draw the line (from start to base of arrowhead) with feathering
-        line_path = QPainterPath()
-        line_path.moveTo(start)
-        line_path.lineTo(QPoint(int(base_x), int(base_y)))
-        self._draw_feathered_path(painter, line_path, color, line_width)
-
-        # Perpendicular direction for arrowhead width
-        perp_x = -ny
-        perp_y = nx
-
-        left_x = base_x + perp_x * head_width
-        left_y = base_y + perp_y * head_width
-        right_x = base_x - perp_x * head_width
-        right_y = base_y - perp_y * head_width
-
-        # Draw arrowhead with glow effect
-        head_path = QPainterPath()
-        head_path.moveTo(end)
-        head_path.lineTo(QPoint(int(left_x), int(left_y)))
-        head_path.lineTo(QPoint(int(right_x), int(right_y)))
-        head_path.closeSubpath()
-
-        # Draw glow layers for arrowhead
-        glow_layers = [
-            (2.2, 20),
-            (1.6, 40),
-            (1.2, 70),
-        ]
+        # Draw the main line on top at full resolution
+        painter.setPen(pens[-1])
+        painter.drawPath(path)
 
-        for scale, alpha in glow_layers:
-            glow_color = QColor(color.red(), color.green(), color.blue(), alpha)
-            painter.setPen(QPen(glow_color, line_width * scale, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            painter.setBrush(glow_color)
-            painter.drawPath(head_path)
+    def _draw_glow(self, painter: QPainter, path: QPainterPath, pens: Tuple[QPen, ...], line_width: int):
+        """Draw the glow layers of a path at half resolution.
 
-        # Draw solid arrowhead
-        painter.setPen(QPen(color, 1))
-        painter.setBrush(color)
-        painter.drawPath(head_path)
+        The glow passes are wide and mostly transparent, so they are rendered
+        without antialiasing into a half-size image that is scaled back up
+        with bilinear filtering; the upscale hides the aliasing and the
+        widest, most overdrawn passes touch a quarter of the pixels.
 
-    def _create_smooth_path(self, points: List[QPoint]) -> QPainterPath:
+        Args:
+            painter: QPainter instance
+            path: Path to draw
+            pens: Glow pens, outermost first
+            line_width: Width of the line
+        """
+        # Work in the target's device pixels, so the glow is at half device
+        # resolution on HiDPI layers too
+        dpr = painter.device().devicePixelRatioF()
+        margin = _glow_margin(line_width)
+        bounds = path.boundingRect().adjusted(-margin, -margin, margin, margin)
+        # Keep the half-res pixel grid on even device coordinates so a growing
+        # live stroke resamples identically outside the partially repainted area
+        left = int(math.floor(bounds.left() * dpr)) & ~1
+        top = int(math.floor(bounds.top() * dpr)) & ~1
+        width = int(math.ceil(bounds.right() * dpr)) - left
+        height = int(math.ceil(bounds.bottom() * dpr)) - top
+
+        glow = QImage((width + 1) // 2, (height + 1) // 2, QImage.Format_ARGB32_Premultiplied)
+        glow.fill(Qt.transparent)
+
+        glow_painter = QPainter(glow)
+        glow_painter.scale(dpr / 2, dpr / 2)
+        glow_painter.translate(-left / dpr, -top / dpr)
+        for pen in pens:
+            glow_painter.setPen(pen)
+            glow_painter.drawPath(path)
+        glow_painter.end()
+
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(QRectF(left / dpr, top / dpr, glow.width() * 2 / dpr, glow.height() * 2 / dpr), glow)
+        painter.restore()
+
+    def _create_smooth_path(self, points: List[QPoint], line_width: int = 4) -> QPainterPath:
         """Create a smooth curved path from a list of points using Catmull-Rom splines.
 
         Args:
             points: List of QPoint objects
+            line_width: Unused; shared builder signature (see _path_builders)
 
         Returns:
             QPainterPath: Smoothed path
@@ -855,26 +1700,70 @@ class OverlayWindow(QWidget):
         # Use Catmull-Rom spline for extra smooth curves
         path.moveTo(points[0])
 
-        for i in range(len(points) - 1):
-            # Get control points for Catmull-Rom spline
-            p0 = points[max(0, i - 1)]
-            p1 = points[i]
-            p2 = points[min(len(points) - 1, i + 1)]
-            p3 = points[min(len(points) - 1, i + 2)]
-
-            # Calculate control points for cubic Bezier
-            # Using Catmull-Rom to Bezier conversion
-            cp1_x = p1.x() + (p2.x() - p0.x()) / 6.0
-            cp1_y = p1.y() + (p2.y() - p0.y()) / 6.0
-            cp2_x = p2.x() - (p3.x() - p1.x()) / 6.0
-            cp2_y = p2.y() - (p3.y() - p1.y()) / 6.0
-
-            path.cubicTo(
-                QPoint(int(cp1_x), int(cp1_y)),
-                QPoint(int(cp2_x), int(cp2_y)),
-                p2
-            )
+        # Float overload of cubicTo: no QPoint allocations per segment
+        for cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y in _catmull_rom_segments(points):
+            path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y)
+
+        return path
+
+    def _advance_live_segments(self) -> Tuple[float, ...]:
+        """Bring the settled segments of the freehand stroke up to date.
+
+        Every segment except the last depends only on points that are
+        already known, so each is computed once as the stroke grows; only
+        the last one is recomputed. Needs at least 3 points.
+
+        Returns:
+            The last (still changing) segment, in the _live_segments format
+        """
+        points = self.current_path
+        count = len(points)
+        if self._live_source is not points or count < self._live_point_count:
+            # A new stroke was started
+            self._live_path = QPainterPath()
+            self._live_path.moveTo(points[0])
+            self._live_source = points
+            self._live_settled = 0
+            self._live_segments = []
+            self._live_boxes = []
+            self._live_box = None
+        self._live_point_count = count
+
+        settled = count - 2
+        if settled > self._live_settled:
+            start = points[self._live_settled]
+            start_x, start_y = start.x(), start.y()
+            box = self._live_box
+            for cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y in _catmull_rom_segments(points, self._live_settled, settled):
+                self._live_path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y)
+                segment = (start_x, start_y, cp1_x, cp1_y, cp2_x, cp2_y, end_x, end_y)
+                segment_box = _segment_box(segment)
+                self._live_segments.append(segment)
+                self._live_boxes.append(segment_box)
+                if box is None:
+                    box = segment_box
+                else:
+                    box = (min(box[0], segment_box[0]), min(box[1], segment_box[1]),
+                           max(box[2], segment_box[2]), max(box[3], segment_box[3]))
+                start_x, start_y = end_x, end_y
+            self._live_box = box
+            self._live_settled = settled
+
+        start = points[settled]
+        return (start.x(), start.y()) + _catmull_rom_segments(points, settled)[0]
+
+    def _live_smooth_path(self) -> QPainterPath:
+        """Get the smoothed path of the freehand stroke being drawn.
+
+        Returns:
+            QPainterPath: Same path as _create_smooth_path(self.current_path)
+        """
+        if len(self.current_path) < 3:
+            return self._create_smooth_path(self.current_path)
 
+        tail = self._advance_live_segments()
+        path = QPainterPath(self._live_path)
+        path.cubicTo(*tail[2:])
         return path
 
     def _create_path_for_mode(self, points: List[QPoint], mode: DrawingMode, line_width: int = 4) -> QPainterPath:
@@ -888,24 +1777,14 @@ class OverlayWindow(QWidget):
         Returns:
             QPainterPath: Path for the given mode
         """
-        if mode == DrawingMode.FREEHAND:
-            return self._create_smooth_path(points)
-        elif mode == DrawingMode.LINE:
-            return self._create_line_path(points)
-        elif mode == DrawingMode.RECTANGLE:
-            return self._create_rectangle_path(points)
-        elif mode == DrawingMode.ARROW:
-            return self._create_arrow_path(points, line_width)
-        elif mode == DrawingMode.CIRCLE:
-            return self._create_circle_path(points)
-        else:
-            return self._create_smooth_path(points)
+        return self._path_builders.get(mode, self._create_smooth_path)(points, line_width)
 
-    def _create_line_path(self, points: List[QPoint]) -> QPainterPath:
+    def _create_line_path(self, points: List[QPoint], line_width: int = 4) -> QPainterPath:
         """Create a straight line path (no smoothing).
 
         Args:
             points: List of QPoint objects (expects 2 points)
+            line_width: Unused; shared builder signature (see _path_builders)
 
         Returns:
             QPainterPath: Straight line path
@@ -925,11 +1804,12 @@ class OverlayWindow(QWidget):
         path.lineTo(points[-1])
         return path
 
-    def _create_rectangle_path(self, points: List[QPoint]) -> QPainterPath:
+    def _create_rectangle_path(self, points: List[QPoint], line_width: int = 4) -> QPainterPath:
         """Create a rectangle path with sharp corners (no smoothing).
 
         Args:
             points: List of QPoint objects (expects 2 points: start and end)
+            line_width: Unused; shared builder signature (see _path_builders)
 
         Returns:
             QPainterPath: Rectangle path
@@ -982,18 +1862,24 @@ class OverlayWindow(QWidget):
 
         # Calculate arrowhead - scale with line width
         arrow_size = max(line_width * 3, 12)  # Scale with line width, minimum 12
-        angle = math.atan2(p2.y() - p1.y(), p2.x() - p1.x())
 
-        # Calculate arrowhead points
-        arrow_angle = math.pi / 6  # 30 degrees
+        # Unit direction of the shaft (no trig: the sides are the direction
+        # rotated by +/-30 degrees, written out with precomputed cos/sin)
+        dx = p2.x() - p1.x()
+        dy = p2.y() - p1.y()
+        length = math.hypot(dx, dy)
+        if length > 0:
+            nx, ny = dx / length, dy / length
+        else:
+            nx, ny = 1.0, 0.0
 
         # Left side of arrowhead
-        left_x = p2.x() - arrow_size * math.cos(angle - arrow_angle)
-        left_y = p2.y() - arrow_size * math.sin(angle - arrow_angle)
+        left_x = p2.x() - arrow_size * (nx * _ARROWHEAD_COS + ny * _ARROWHEAD_SIN)
+        left_y = p2.y() - arrow_size * (ny * _ARROWHEAD_COS - nx * _ARROWHEAD_SIN)
 
         # Right side of arrowhead
-        right_x = p2.x() - arrow_size * math.cos(angle + arrow_angle)
-        right_y = p2.y() - arrow_size * math.sin(angle + arrow_angle)
+        right_x = p2.x() - arrow_size * (nx * _ARROWHEAD_COS - ny * _ARROWHEAD_SIN)
+        right_y = p2.y() - arrow_size * (ny * _ARROWHEAD_COS + nx * _ARROWHEAD_SIN)
 
         # Draw arrowhead lines
         path.moveTo(p2)
@@ -1003,11 +1889,12 @@ class OverlayWindow(QWidget):
 
         return path
 
-    def _create_circle_path(self, points: List[QPoint]) -> QPainterPath:
+    def _create_circle_path(self, points: List[QPoint], line_width: int = 4) -> QPainterPath:
         """Create a circle path from center to edge point.
 
         Args:
             points: List of QPoint objects (expects 2 points: center and edge)
+            line_width: Unused; shared builder signature (see _path_builders)
 
         Returns:
             QPainterPath: Circle path
@@ -1026,7 +1913,7 @@ class OverlayWindow(QWidget):
         center, edge = points[0], points[-1]
         dx = edge.x() - center.x()
         dy = edge.y() - center.y()
-        radius = int(math.sqrt(dx * dx + dy * dy))
+        radius = int(math.hypot(dx, dy))
 
         if radius < 2:
             path.addEllipse(center, 2, 2)
@@ -1041,25 +1928,6 @@ class OverlayWindow(QWidget):
         Args:
             painter: QPainter instance
         """
-        radius = self.config.get("spotlight", "radius")
-        color_hex = self.config.get("spotlight", "color")
-        opacity = self.config.get("spotlight", "opacity")
-        base_color = QColor(color_hex)
-
-        # Draw bright glowing circle around cursor with opacity control
-        gradient = QRadialGradient(self.last_cursor_pos, radius)
-        gradient.setColorAt(0, QColor(base_color.red(), base_color.green(), base_color.blue(), int(180 * opacity)))
-        gradient.setColorAt(0.3, QColor(base_color.red(), base_color.green(), base_color.blue(), int(120 * opacity)))
-        gradient.setColorAt(0.7, QColor(base_color.red(), base_color.green(), base_color.blue(), int(60 * opacity)))
-        gradient.setColorAt(1, QColor(255, 255, 255, 0))  # Transparent edge
-
-        painter.setBrush(gradient)
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(self.last_cursor_pos, radius, radius)
-
-        # Draw bright ring for emphasis
-        ring_radius = self.config.get("spotlight", "ring_radius")
-        pen = QPen(QColor(base_color.red(), base_color.green(), base_color.blue(), int(200 * opacity)), 3)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(self.last_cursor_pos, ring_radius, ring_radius)
+        pos = self.last_cursor_pos
+        extent = self._spotlight_extent
+        painter.drawPixmap(pos.x() - extent, pos.y() - extent, self._spotlight_pixmap)
@@ -392,5 +392,5 @@ class SettingsDialog(QDialog):
             self.config.set(self.ring_radius_slider.value(), "spotlight", "ring_radius")
             self.config.set(self.opacity_slider.value() / 100.0, "spotlight", "opacity")
             self.config.set(self.spotlight_color, "spotlight", "color")
-            # Force overlay to repaint
-            self.overlay.update()
+            # Refresh the overlay's cached settings and repaint
+            self.overlay.reload_settings()